@@ -1,3 +1,15 @@
-from .client import Client, AsyncClient
+from typing import TYPE_CHECKING
 
-__all__ = ["Client", "AsyncClient"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .client import Client, AsyncClient
+
+__all__ = ["Client", "AsyncClient"]
+
+
+def __getattr__(name: str):
+    # Import the clients on first access, so that the CLI (which lives in this
+    # package) does not load every command module before parsing arguments.
+    if name in __all__:
+        from . import client
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,12 +7,8 @@ import asyncio
 import argparse
 import logging
 import sys
-from bleak import BleakScanner
 
 from .lib.logging import setup_logging
-from .lib.device_session import DeviceSession
-from .websocket import build_command_args
-from .commands import COMMANDS
 from .__version__ import VERSION
 
 logger = logging.getLogger(__name__)
@@ -26,6 +22,11 @@ async def run_commands(commands: list[tuple[str, ...]], address: str) -> None:
         commands: List of command tuples (command_name, *params).
         address: Bluetooth device address.
     """
+    # Imported here so that --scan and --help do not load every command
+    from .lib.device_session import DeviceSession
+    from .websocket import build_command_args
+    from .commands import COMMANDS
+
     async with DeviceSession(address) as session:
         # Device info is automatically retrieved on connection
         device_info = session.get_device_info()
@@ -38,21 +39,26 @@ async def run_commands(commands: list[tuple[str, ...]], address: str) -> None:
             if command_name == "get_device_info":
                 # Special case: get_device_info is now just a getter
                 logger.info(str(device_info))
-            elif command_name in COMMANDS:
-                positional_args, keyword_args = build_command_args(params)
-                command_func = COMMANDS[command_name]
-                result = await session.execute_command(command_func, *positional_args, **keyword_args)
-                
-                # Display result if it has data
-                if result.data is not None:
-                    logger.info(result.format_for_display())
-                else:
-                    logger.info(f"Command '{command_name}' executed successfully.")
-            else:
+                continue
+
+            command_func = COMMANDS.get(command_name)
+            if command_func is None:
                 logger.error(f"Unknown command: {command_name}")
+                continue
+
+            positional_args, keyword_args = build_command_args(params)
+            result = await session.execute_command(command_func, *positional_args, **keyword_args)
+            
+            # Display result if it has data
+            if result.data is not None:
+                logger.info(result.format_for_display())
+            else:
+                logger.info(f"Command '{command_name}' executed successfully.")
 
 async def scan_devices() -> None:
     """Scan for Bluetooth devices with 'LED' in their name."""
+    from bleak import BleakScanner
+
     logger.info("Scanning for Bluetooth devices...")
     devices = await BleakScanner.discover()
     if devices:
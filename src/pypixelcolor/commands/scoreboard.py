@@ -16,9 +16,13 @@ Both commands send the result as a static image using the same transport as
 
 from __future__ import annotations
 
+import re
+import threading
+from functools import lru_cache
 from io import BytesIO
 from logging import getLogger
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Optional, Sequence, Tuple
 
 from PIL import Image
 
@@ -44,55 +48,63 @@ _POSITION_SCORE_SEPARATOR_X = 30
 
 _SCORE_GAP = 1  # gap between digits in the score display
 
+# vertical step between 3x5 characters, including the 1-pixel spacing
+_TEAMNAME_CHAR_STEP = 3 + 1  # rotated glyphs are 3 pixels high
+_SETS_CHAR_STEP = 5 + 1  # unrotated glyphs are 5 pixels high
+
+# PNG output buffers reused across renders instead of allocating a new one
+# each time. One buffer per thread, so concurrent renders need no locking.
+_thread_local = threading.local()
+
 # 3x5 bitmap font: characters A–Z, 0–9
-# Each glyph is a list of 5 strings of length 3, with '1' = LED on, '0' = off.
-GLYPH_3X5: Dict[str, List[str]] = {
+# Each glyph is a tuple of 5 strings of length 3, with '1' = LED on, '0' = off.
+GLYPH_3X5: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
     # Digits
-    "0": ["111", "101", "101", "101", "111"],
-    "1": ["010", "110", "010", "010", "111"],
-    "2": ["111", "001", "111", "100", "111"],
-    "3": ["111", "001", "111", "001", "111"],
-    "4": ["101", "101", "111", "001", "001"],
-    "5": ["111", "100", "111", "001", "111"],
-    "6": ["111", "100", "111", "101", "111"],
-    "7": ["111", "001", "010", "010", "010"],
-    "8": ["111", "101", "111", "101", "111"],
-    "9": ["111", "101", "111", "001", "111"],
+    "0": ("111", "101", "101", "101", "111"),
+    "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"),
+    "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"),
+    "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"),
+    "7": ("111", "001", "010", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"),
+    "9": ("111", "101", "111", "001", "111"),
     # Uppercase letters
-    "A": ["111", "101", "111", "101", "101"],
-    "B": ["110", "101", "110", "101", "110"],
-    "C": ["111", "100", "100", "100", "111"],
-    "D": ["110", "101", "101", "101", "110"],
-    "E": ["111", "100", "110", "100", "111"],
-    "F": ["111", "100", "110", "100", "100"],
-    "G": ["011", "100", "101", "101", "011"],
-    "H": ["101", "101", "111", "101", "101"],
-    "I": ["111", "010", "010", "010", "111"],
-    "J": ["111", "001", "001", "101", "111"],
-    "K": ["101", "110", "100", "110", "101"],
-    "L": ["100", "100", "100", "100", "111"],
-    "M": ["101", "111", "101", "101", "101"],
-    "N": ["101", "111", "111", "111", "101"],
-    "O": ["111", "101", "101", "101", "111"],
-    "P": ["111", "101", "111", "100", "100"],
-    "Q": ["111", "101", "101", "111", "011"],
-    "R": ["111", "101", "111", "110", "101"],
-    "S": ["111", "100", "111", "001", "111"],
-    "T": ["111", "010", "010", "010", "010"],
-    "U": ["101", "101", "101", "101", "111"],
-    "V": ["101", "101", "101", "101", "010"],
-    "W": ["101", "101", "111", "111", "101"],
-    "X": ["101", "101", "010", "101", "101"],
-    "Y": ["101", "101", "010", "010", "010"],
-    "Z": ["111", "001", "010", "100", "111"],
-}
+    "A": ("111", "101", "111", "101", "101"),
+    "B": ("110", "101", "110", "101", "110"),
+    "C": ("111", "100", "100", "100", "111"),
+    "D": ("110", "101", "101", "101", "110"),
+    "E": ("111", "100", "110", "100", "111"),
+    "F": ("111", "100", "110", "100", "100"),
+    "G": ("011", "100", "101", "101", "011"),
+    "H": ("101", "101", "111", "101", "101"),
+    "I": ("111", "010", "010", "010", "111"),
+    "J": ("111", "001", "001", "101", "111"),
+    "K": ("101", "110", "100", "110", "101"),
+    "L": ("100", "100", "100", "100", "111"),
+    "M": ("101", "111", "101", "101", "101"),
+    "N": ("101", "111", "111", "111", "101"),
+    "O": ("111", "101", "101", "101", "111"),
+    "P": ("111", "101", "111", "100", "100"),
+    "Q": ("111", "101", "101", "111", "011"),
+    "R": ("111", "101", "111", "110", "101"),
+    "S": ("111", "100", "111", "001", "111"),
+    "T": ("111", "010", "010", "010", "010"),
+    "U": ("101", "101", "101", "101", "111"),
+    "V": ("101", "101", "101", "101", "010"),
+    "W": ("101", "101", "111", "111", "101"),
+    "X": ("101", "101", "010", "101", "101"),
+    "Y": ("101", "101", "010", "010", "010"),
+    "Z": ("111", "001", "010", "100", "111"),
+})
 
 
 # 16-pixel high font for score digits and colon (legacy 8-pixel-wide version).
-# Each glyph is a list of 16 strings. Digits are 8 pixels wide,
+# Each glyph is a tuple of 16 strings. Digits are 8 pixels wide,
 # the colon is 4 pixels wide.
-GLYPH_SCORE: Dict[str, List[str]] = {
-    "0": [
+GLYPH_SCORE: Final[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "0": (
         "01111110",
         "11111111",
         "11000011",
@@ -109,8 +121,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "11000011",
         "11111111",
         "01111110"
-    ],
-    "1": [
+    ),
+    "1": (
         "00011000",
         "00011000",
         "00111000",
@@ -127,8 +139,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "00011000",
         "00011000",
         "00011000"
-    ],
-    "2": [
+    ),
+    "2": (
         "11111110",
         "11111111",
         "00000011",
@@ -145,8 +157,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "11000000",
         "11111111",
         "01111111"
-    ],
-    "3": [
+    ),
+    "3": (
         "11111110",
         "11111111",
         "00000011",
@@ -163,8 +175,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "00000011",
         "11111111",
         "11111110"
-    ],
-    "4": [
+    ),
+    "4": (
         "11000011",
         "11000011",
         "11000011",
@@ -181,8 +193,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "00000011",
         "00000011",
         "00000011"
-    ],
-    "5": [
+    ),
+    "5": (
         "11111111",
         "11111111",
         "11000000",
@@ -199,8 +211,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "00000011",
         "11111111",
         "11111110"
-    ],
-    "6": [
+    ),
+    "6": (
         "01111111",
         "11111111",
         "11000000",
@@ -217,8 +229,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "11000011",
         "11111111",
         "01111110"
-    ],
-    "7": [
+    ),
+    "7": (
         "11111111",
         "11111111",
         "00000011",
@@ -235,8 +247,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "01100000",
         "11000000",
         "11000000"
-    ],
-    "8": [
+    ),
+    "8": (
         "01111110",
         "11111111",
         "11000011",
@@ -253,8 +265,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "11000011",
         "11111111",
         "01111110"
-    ],
-    "9": [
+    ),
+    "9": (
         "01111110",
         "11111111",
         "11000011",
@@ -271,8 +283,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "00000011",
         "11111111",
         "11111110"
-    ],
-    ":": [
+    ),
+    ":": (
         "0000",
         "0000",
         "0110",
@@ -289,8 +301,8 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "0110",
         "0000",
         "0000",
-    ],
-    "c": [
+    ),
+    "c": (
         "0110",
         "0110",
         "0110",
@@ -307,139 +319,156 @@ GLYPH_SCORE: Dict[str, List[str]] = {
         "0110",
         "0110",
         "0110",
-    ],
-}
+    ),
+})
+
+
+_COLOR_HEX_ERROR = "Color must be a 6-character hexadecimal string, e.g. 'FF0000'."
 
 
 def _parse_color_hex(color: str) -> Tuple[int, int, int]:
     """Parse a 6-char hex color into an (R, G, B) tuple."""
-    if not isinstance(color, str) or len(color) != 6 or not all(c in "0123456789abcdefABCDEF" for c in color):
-        raise ValueError("Color must be a 6-character hexadecimal string, e.g. 'FF0000'.")
-    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+    if not isinstance(color, str) or len(color) != 6:
+        raise ValueError(_COLOR_HEX_ERROR)
+    return _parse_color_hex_str(color)
 
 
+@lru_cache(maxsize=256)
+def _parse_color_hex_str(color: str) -> Tuple[int, int, int]:
+    """Memoized core of _parse_color_hex, for 6-character strings.
 
-def _draw_glyph_3x5(
-    img: Image.Image,
-    glyph: List[str],
-    x_offset: int,
-    y_offset: int,
-    color: Tuple[int, int, int],
-) -> None:
-    """Draw a single 3x5 glyph at (x_offset, y_offset)."""
-    width, height = img.size
-    r, g, b = color
+    A scoreboard is usually updated many times with the same color.
+    """
+    try:
+        rgb = bytes.fromhex(color)
+    except ValueError:
+        raise ValueError(_COLOR_HEX_ERROR) from None
+    # fromhex skips whitespace, so 6 characters may still yield fewer bytes
+    if len(rgb) != 3:
+        raise ValueError(_COLOR_HEX_ERROR)
+    return rgb[0], rgb[1], rgb[2]
 
-    for row_idx, row in enumerate(glyph):
-        y = y_offset + row_idx
-        if y < 0 or y >= height:
-            continue
-        for col_idx, ch in enumerate(row):
-            if ch != "1":
-                continue
-            x = x_offset + col_idx
-            if 0 <= x < width:
-                img.putpixel((x, y), (r, g, b))
 
+# Matches every character that has no 3x5 glyph
+_UNSUPPORTED_NAME_CHARS_RE = re.compile("[^" + re.escape("".join(GLYPH_3X5)) + "]")
 
-def _draw_glyph_3x5_rotated_ccw(
-    img: Image.Image,
-    glyph: List[str],
-    x_offset: int,
-    y_offset: int,
-    color: Tuple[int, int, int],
-) -> None:
-    """Draw a 3x5 glyph rotated 90° counter-clockwise.
 
-    The original glyph is 3 columns × 5 rows. After rotation it becomes
-    5 columns × 3 rows. This is used for the left team name so letters
-    are turned towards the center.
+# Common score and sets forms ("03:12" / "0312", "1:2" / "12"), matched in a
+# single pass before falling back to the detailed checks
+_SCORE_RE = re.compile(r"([0-9]{2}):?([0-9]{2})")
+_SETS_RE = re.compile(r"([0-9]+):([0-9]+)|([0-9])([0-9])")
+
+
+def _glyph_mask(glyph: Sequence[str]) -> Image.Image:
+    """Build a 1-bit mask from a glyph ('1' = LED on).
+
+    Each row is packed into an integer bitmask and written as a big-endian,
+    byte-padded scanline, which is the raw layout of a mode "1" image.
     """
-    width, height = img.size
-    r, g, b = color
+    glyph_h = len(glyph)
+    glyph_w = len(glyph[0]) if glyph else 0
+    row_bytes = (glyph_w + 7) // 8
+    pad = row_bytes * 8 - glyph_w
+    data = b"".join((int(row, 2) << pad).to_bytes(row_bytes, "big") for row in glyph)
+    return Image.frombytes("1", (glyph_w, glyph_h), data)
+
+
+# Glyphs pre-rendered as 1-bit masks at import time, so drawing a glyph is a
+# single ``Image.paste`` call instead of one ``putpixel`` call per lit LED.
+# The rotated variants are used for the team names on the sides.
+_GLYPH_3X5_MASKS: Dict[str, Image.Image] = {ch: _glyph_mask(g) for ch, g in GLYPH_3X5.items()}
+_GLYPH_3X5_MASKS_CCW: Dict[str, Image.Image] = {
+    ch: m.transpose(Image.Transpose.ROTATE_90) for ch, m in _GLYPH_3X5_MASKS.items()
+}
+_GLYPH_3X5_MASKS_CW: Dict[str, Image.Image] = {
+    ch: m.transpose(Image.Transpose.ROTATE_270) for ch, m in _GLYPH_3X5_MASKS.items()
+}
+_GLYPH_SCORE_MASKS: Dict[str, Image.Image] = {ch: _glyph_mask(g) for ch, g in GLYPH_SCORE.items()}
 
-    if not glyph:
-        return
 
-    glyph_h = len(glyph)  # 5
-    glyph_w = len(glyph[0])  # 3
+def _score_pair_mask(value: str) -> Image.Image:
+    """Compose the mask of a two-digit score side ("00".."99")."""
+    pair = Image.new("1", (2 * _SCORE_DIGIT_WIDTH + _SCORE_GAP, _SCORE_PANEL_HEIGHT), 0)
+    pair.paste(_GLYPH_SCORE_MASKS[value[0]], (0, 0))
+    pair.paste(_GLYPH_SCORE_MASKS[value[1]], (_SCORE_DIGIT_WIDTH + _SCORE_GAP, 0))
+    return pair
 
-    for row_idx, row in enumerate(glyph):
-        if len(row) != glyph_w:
-            continue
-        for col_idx, ch in enumerate(row):
-            if ch != "1":
-                continue
-            # Rotate (col, row) -> (row, glyph_w - 1 - col)
-            x = x_offset + row_idx
-            y = y_offset + (glyph_w - 1 - col_idx)
-            if 0 <= x < width and 0 <= y < height:
-                img.putpixel((x, y), (r, g, b))
 
+# Both digits of a side score composed into one mask, so a side is drawn
+# with a single paste.
+_SCORE_PAIR_MASKS: Dict[str, Image.Image] = {
+    f"{i:02d}": _score_pair_mask(f"{i:02d}") for i in range(100)
+}
 
-def _draw_glyph_3x5_rotated_cw(
-    img: Image.Image,
-    glyph: List[str],
-    x_offset: int,
-    y_offset: int,
-    color: Tuple[int, int, int],
-) -> None:
-    """Draw a 3x5 glyph rotated 90° clockwise.
 
-    After rotation the glyph is 5 columns × 3 rows. This is used for the
-    right team name so letters are turned towards the center.
+@lru_cache(maxsize=64)
+def _team_name_mask(name: str, side: str) -> Image.Image:
+    """Compose the mask of a team name as one vertical strip.
+
+    Glyphs are rotated towards the center and separated by one empty row:
+    the left name is rotated CCW and reads bottom to top, the right name is
+    rotated CW and reads top to bottom. The whole side is then drawn with a
+    single paste.
     """
-    width, height = img.size
-    r, g, b = color
+    strip_h = max(len(name) * _TEAMNAME_CHAR_STEP - 1, 0)
+    strip = Image.new("1", (5, strip_h), 0)
+    if side == "left":
+        masks = _GLYPH_3X5_MASKS_CCW
+        name = name[::-1]
+    else:
+        masks = _GLYPH_3X5_MASKS_CW
+    # Names are filtered against GLYPH_3X5 beforehand, every char has a mask
+    for idx, ch in enumerate(name):
+        strip.paste(masks[ch], (0, idx * _TEAMNAME_CHAR_STEP))
+    return strip
 
-    if not glyph:
-        return
 
-    glyph_h = len(glyph)  # 5
-    glyph_w = len(glyph[0])  # 3
+@lru_cache(maxsize=128)
+def _sets_mask(value: str) -> Image.Image:
+    """Compose the mask of a sets value (one or two digits stacked vertically).
 
-    for row_idx, row in enumerate(glyph):
-        if len(row) != glyph_w:
+    Digits are unrotated 3x5 glyphs separated by one empty row. Characters
+    without a glyph leave their slot empty.
+    """
+    strip_h = len(value) * _SETS_CHAR_STEP - 1
+    strip = Image.new("1", (3, strip_h), 0)
+    for idx, ch in enumerate(value):
+        mask = _GLYPH_3X5_MASKS.get(ch)
+        if mask is None:
             continue
-        for col_idx, ch in enumerate(row):
-            if ch != "1":
-                continue
-            # Rotate (col, row) -> (glyph_h - 1 - row, col)
-            x = x_offset + (glyph_h - 1 - row_idx)
-            y = y_offset + col_idx
-            if 0 <= x < width and 0 <= y < height:
-                img.putpixel((x, y), (r, g, b))
+        strip.paste(mask, (0, idx * _SETS_CHAR_STEP))
+    return strip
 
 
-def _draw_score_glyph(
+def _draw_two_digits(
     img: Image.Image,
-    glyph: List[str],
+    value: str,
     x_offset: int,
-    y_offset: int,
     color: Tuple[int, int, int],
 ) -> None:
-    """Draw a score glyph (16 rows) at (x_offset, y_offset)."""
-    width, height = img.size
-    r, g, b = color
-
-    for row_idx, row in enumerate(glyph):
-        y = y_offset + row_idx
-        if y < 0 or y >= height:
-            continue
-        for col_idx, ch in enumerate(row):
-            if ch != "1":
-                continue
-            x = x_offset + col_idx
-            if 0 <= x < width:
-                img.putpixel((x, y), (r, g, b))
+    """Draw a two-digit score side (e.g. '03') at (x_offset, 0)."""
+    mask = _SCORE_PAIR_MASKS.get(value)
+    if mask is None:
+        raise ValueError("Each side score must be two digits (e.g. '03')")
+    img.paste(color, (x_offset, 0), mask)
 
 
 def _parse_score(score: str) -> Tuple[str, str]:
     """Parse a score string like '00:00' or '00 : 00' into (left, right)."""
     if not isinstance(score, str):
         raise ValueError("score must be a string like '00:00'")
+    return _parse_score_str(score)
 
+
+@lru_cache(maxsize=1024)
+def _parse_score_str(score: str) -> Tuple[str, str]:
+    """Memoized core of _parse_score, for values already known to be strings."""
     s = score.strip().replace(" ", "")
+    m = _SCORE_RE.fullmatch(s)
+    if m:
+        return m.group(1), m.group(2)
+
+    # Slow path, only used to report what is wrong with the value
     if ":" in s:
         left, right = s.split(":", 1)
     elif len(s) == 4 and s.isdigit():
@@ -461,11 +490,23 @@ def _parse_sets(sets: str) -> Tuple[str, str]:
     """
     if not isinstance(sets, str):
         raise ValueError("sets must be a string like '1:2'")
+    return _parse_sets_str(sets)
+
 
+@lru_cache(maxsize=1024)
+def _parse_sets_str(sets: str) -> Tuple[str, str]:
+    """Memoized core of _parse_sets, for values already known to be strings."""
     s = sets.strip().replace(" ", "")
     if not s:
         raise ValueError("sets string cannot be empty")
 
+    m = _SETS_RE.fullmatch(s)
+    if m:
+        if m.group(1) is not None:
+            return m.group(1), m.group(2)
+        return m.group(3), m.group(4)
+
+    # Slow path: non-ASCII digits and invalid values
     if ":" in s:
         left, right = s.split(":", 1)
     elif len(s) == 2 and s.isdigit():
@@ -479,6 +520,118 @@ def _parse_sets(sets: str) -> Tuple[str, str]:
     return left, right
 
 
+@lru_cache(maxsize=256)
+def _normalize_team_name(name: str) -> str:
+    """Uppercase and clamp a team name to 4 characters, then drop the
+    characters that have no 3x5 glyph.
+
+    The clamp is applied before filtering, so unsupported characters still
+    use up one of the 4 slots.
+    """
+    return _UNSUPPORTED_NAME_CHARS_RE.sub("", name.upper()[:4])
+
+
+def _normalize_sets(value: Optional[str], label: str) -> str:
+    """Normalize one side of the sets value ("" when there is nothing to draw).
+
+    Not memoized: a non-numeric value must log its warning on every call.
+    """
+    if value is None:
+        return ""
+    s = str(value).strip()
+    if not s:
+        return ""
+    if not s.isdigit():
+        logger.warning("%s sets value '%s' is not numeric; ignoring", label, value)
+        return ""
+    # Limit to at most 2 digits to keep it compact
+    return s[:2]
+
+
+@lru_cache(maxsize=32)
+def _build_static_template(
+    team_left: str,
+    team_right: str,
+    main_color: Tuple[int, int, int],
+    width: int,
+    height: int,
+) -> Image.Image:
+    """Draw the parts of the scoreboard that rarely change.
+
+    The team names and the score separator only depend on the teams and the
+    main color, so they are drawn once and reused as the starting canvas for
+    every score update. The returned image is shared: copy it before drawing.
+    """
+    # Create blank canvas
+    img = Image.new("RGB", (width, height), (0, 0, 0))
+
+    # Draw side names (3x5 font rotated towards the center), from Y = 0
+    if team_left:
+        img.paste(main_color, (_POSITION_T1_TEAMNAME_X, 0), _team_name_mask(team_left, "left"))
+    if team_right:
+        img.paste(main_color, (_POSITION_T2_TEAMNAME_X, 0), _team_name_mask(team_right, "right"))
+
+    # Dessiner le deux-points avec la police 8x16, positionné à une X fixe
+    img.paste(main_color, (_POSITION_SCORE_SEPARATOR_X, 0), _GLYPH_SCORE_MASKS[":"])
+
+    return img
+
+
+def _png_buffer() -> BytesIO:
+    """Return this thread's PNG output buffer, emptied."""
+    buffer = getattr(_thread_local, "png_buffer", None)
+    if buffer is None:
+        buffer = _thread_local.png_buffer = BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate(0)
+    return buffer
+
+
+@lru_cache(maxsize=128)
+def _render_sb_png(
+    team_left: str,
+    team_right: str,
+    sets_left_str: str,
+    sets_right_str: str,
+    left_score: str,
+    right_score: str,
+    main_color: Tuple[int, int, int],
+    width: int,
+    height: int,
+) -> bytes:
+    """Render the scoreboard and return it as PNG bytes.
+
+    Only takes already validated and normalized values, so that equivalent
+    ``set_sb_score`` calls share the same cache entry. A scoreboard is
+    typically re-sent many times with unchanged content, in which case both
+    the drawing and the PNG encoding are skipped.
+    """
+    # Start from the cached names + separator layer
+    img = _build_static_template(team_left, team_right, main_color, width, height).copy()
+
+    # Colors: green on the left, red on the right (used for sets and scores)
+    left_sets_color = (0, 255, 0)
+    right_sets_color = (255, 0, 0)
+
+    # Draw number of sets (between team name and score) at fixed X
+    if sets_left_str:
+        img.paste(left_sets_color, (_POSITION_T1_SET_X, 0), _sets_mask(sets_left_str))
+    if sets_right_str:
+        img.paste(right_sets_color, (_POSITION_T2_SET_X, 0), _sets_mask(sets_right_str))
+
+    # Draw both score sides at fixed X (Y is 0)
+    _draw_two_digits(img, left_score, _POSITION_T1_SCORE_X, left_sets_color)
+    _draw_two_digits(img, right_score, _POSITION_T2_SCORE_X, right_sets_color)
+
+    # Convert image to PNG bytes. The device only accepts encoded images, so
+    # the PNG step stays, but with the fastest deflate level: the sparse
+    # scoreboard compresses well anyway and stays far below one window.
+    buffer = _png_buffer()
+    img.save(buffer, format="PNG", compress_level=1, optimize=False)
+    return buffer.getvalue()
+
+
 def set_sb_score(
     team_left: str,
     team_right: str,
@@ -520,69 +673,23 @@ def set_sb_score(
     if width < _SCORE_PANEL_WIDTH:
         raise ValueError(f"Matrix width must be at least {_SCORE_PANEL_WIDTH} pixels (5 per side)")
 
-    # Normalize and clamp team names
-    team_left = (team_left or "").upper()[:4]
-    team_right = (team_right or "").upper()[:4]
-
-    # Filter unsupported characters (keep only those present in GLYPH_3X5)
-    filtered_left = "".join(ch for ch in team_left if ch in GLYPH_3X5)
-    filtered_right = "".join(ch for ch in team_right if ch in GLYPH_3X5)
+    # Normalize team names and drop unsupported characters
+    team_left = team_left or ""
+    team_right = team_right or ""
+    filtered_left = _normalize_team_name(team_left)
+    filtered_right = _normalize_team_name(team_right)
 
     if not filtered_left:
-        logger.warning("Left team name '%s' has no supported characters (A-Z, 0-9)", team_left)
+        logger.warning("Left team name '%s' has no supported characters (A-Z, 0-9)", team_left.upper()[:4])
     if not filtered_right:
-        logger.warning("Right team name '%s' has no supported characters (A-Z, 0-9)", team_right)
+        logger.warning("Right team name '%s' has no supported characters (A-Z, 0-9)", team_right.upper()[:4])
 
     team_left = filtered_left
     team_right = filtered_right
 
-    num_left = len(team_left)
-    num_right = len(team_right)
-
-    # After rotation each glyph is 5x3 (width x height)
-    spacing = 1
-    char_h = 3
-    # Fixed vertical anchors for team names (all at Y = 0)
-    y_start_left = 0
-    y_start_right = 0
-
     # Main color for team names and central score
     main_color = _parse_color_hex(color)
 
-    # Create blank canvas
-    img = Image.new("RGB", (width, height), (0, 0, 0))
-
-    # Draw side names (3x5 font rotated towards the center)
-    x_left = _POSITION_T1_TEAMNAME_X
-    for idx, ch in enumerate(team_left):
-        glyph = GLYPH_3X5.get(ch)
-        if glyph is None:
-            continue
-        draw_idx = num_left - 1 - idx
-        y_offset = y_start_left + draw_idx * (char_h + spacing)
-        _draw_glyph_3x5_rotated_ccw(img, glyph, x_left, y_offset, main_color)
-
-    x_right = _POSITION_T2_TEAMNAME_X
-    for idx, ch in enumerate(team_right):
-        glyph = GLYPH_3X5.get(ch)
-        if glyph is None:
-            continue
-        y_offset = y_start_right + idx * (char_h + spacing)
-        _draw_glyph_3x5_rotated_cw(img, glyph, x_right, y_offset, main_color)
-
-    # --- Draw number of sets (between team name and score) ---
-    def _normalize_sets(value: str, label: str) -> str:
-        if value is None:
-            return ""
-        s = str(value).strip()
-        if not s:
-            return ""
-        if not s.isdigit():
-            logger.warning("%s sets value '%s' is not numeric; ignoring", label, value)
-            return ""
-        # Limit to at most 2 digits to keep it compact
-        return s[:2]
-
     # Parse and normalize sets for each team
     try:
         raw_sets_left, raw_sets_right = _parse_sets(sets)
@@ -592,84 +699,20 @@ def set_sb_score(
     sets_left_str = _normalize_sets(raw_sets_left, "Left")
     sets_right_str = _normalize_sets(raw_sets_right, "Right")
 
-    # Colors: green on the left, red on the right (used for sets and scores)
-    left_sets_color = (0, 255, 0)
-    right_sets_color = (255, 0, 0)
-
-    # Unrotated 3x5 digits, centered vertically, placed in a 3-column band
-    sets_char_h = 5
-    sets_spacing = 1
-
-    if sets_left_str:
-        num = len(sets_left_str)
-        x_sets_left = _POSITION_T1_SET_X  # fixed X for left sets
-        y_start_sets_left = 0
-        for idx, ch in enumerate(sets_left_str):
-            glyph = GLYPH_3X5.get(ch)
-            if glyph is None:
-                continue
-            y_offset = y_start_sets_left + idx * (sets_char_h + sets_spacing)
-            _draw_glyph_3x5(img, glyph, x_sets_left, y_offset, left_sets_color)
-
-    if sets_right_str:
-        num = len(sets_right_str)
-        x_sets_right = _POSITION_T2_SET_X  # fixed X for right sets
-        y_start_sets_right = 0
-        for idx, ch in enumerate(sets_right_str):
-            glyph = GLYPH_3X5.get(ch)
-            if glyph is None:
-                continue
-            y_offset = y_start_sets_right + idx * (sets_char_h + sets_spacing)
-            _draw_glyph_3x5(img, glyph, x_sets_right, y_offset, right_sets_color)
-
     # Parse score
     left_score, right_score = _parse_score(score)
 
-    # Fixed positions for score: left/right anchors (Y is 0)
-    digit_w = _SCORE_DIGIT_WIDTH
-    colon_w = _SCORE_COLON_WIDTH
-    gap = 1  # gap around the colon
-    inner_gap = 1  # second digit at X + _SCORE_DIGIT_WIDTH + _SCORE_GAP
-
-    x_left_score = _POSITION_T1_SCORE_X
-    x_right_score = _POSITION_T2_SCORE_X
-    y_offset_score = 0
-
-    # Helper to draw a 2-digit number with a small gap between digits
-    def _draw_two_digits(value: str, x: int, color: Tuple[int, int, int]) -> int:
-        if len(value) != 2 or not value.isdigit():
-            raise ValueError("Each side score must be two digits (e.g. '03')")
-        first, second = value[0], value[1]
-
-        glyph = GLYPH_SCORE.get(first)
-        if glyph is None:
-            raise ValueError(f"Unsupported score digit: {first}")
-        _draw_score_glyph(img, glyph, x, y_offset_score, color)
-        x += digit_w + inner_gap
-
-        glyph = GLYPH_SCORE.get(second)
-        if glyph is None:
-            raise ValueError(f"Unsupported score digit: {second}")
-        _draw_score_glyph(img, glyph, x, y_offset_score, color)
-        x += digit_w
-        return x
-
-    # Draw left score at fixed X
-    _draw_two_digits(left_score, x_left_score, left_sets_color)
-
-    # Dessiner le deux-points avec la police 8x16, positionné à une X fixe
-    colon_glyph = GLYPH_SCORE.get(":")
-    if colon_glyph is None:
-        raise ValueError("Colon glyph missing in score font")
-    _draw_score_glyph(img, colon_glyph, _POSITION_SCORE_SEPARATOR_X, y_offset_score, main_color)
-
-    # Draw right score at fixed X
-    _draw_two_digits(right_score, x_right_score, right_sets_color)
-
-    # Convert image to PNG bytes
-    buffer = BytesIO()
-    img.save(buffer, format="PNG")
-    png_bytes = buffer.getvalue()
+    png_bytes = _render_sb_png(
+        team_left,
+        team_right,
+        sets_left_str,
+        sets_right_str,
+        left_score,
+        right_score,
+        main_color,
+        width,
+        height,
+    )
 
     return _build_send_plan(png_bytes, is_gif=False, plan_name="set_sb_score", save_slot=0)
 
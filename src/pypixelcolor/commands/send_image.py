@@ -1,12 +1,17 @@
 import logging
 import binascii
+import os
+import struct
+import zlib
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 from PIL import Image, ImageSequence
 from PIL.Image import Palette
 from enum import Enum
 from io import BytesIO
-from ..lib.transport.send_plan import SendPlan, Window
+from ..lib.transport.send_plan import SendPlan
+from ..lib.transport.window import build_windows
 from ..lib.device_info import DeviceInfo
 
 # Register HEIF/HEIC support if available
@@ -25,39 +30,64 @@ class ResizeMethod(Enum):
     CROP = "crop"
     FIT = "fit"
 
-# Helper functions for byte-level transformations
-def _frame_size_bytes(length: int, size_hex_digits: int) -> bytes:
-    """Return the length encoded as little-endian bytes.
+_READ_CHUNK_SIZE = 64 * 1024
 
-    length: number of raw bytes
-    size_hex_digits: number of hex digits used historically (e.g. 4 or 8). We convert to bytes = size_hex_digits//2
-    """
-    byte_count = size_hex_digits // 2
-    return int(length).to_bytes(byte_count, byteorder="little")
+# Method used to compute the shared GIF palette. Fast octree is several
+# times faster than median cut on whole animations, with a small loss of
+# color accuracy that is not visible on LED matrices. Set to
+# Image.Quantize.MEDIANCUT for the most accurate palette.
+_QUANTIZE_METHOD = Image.Quantize.FASTOCTREE
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-def _crc32_le(data: bytes) -> bytes:
-    """Return CRC32 as 4 bytes little-endian for the given raw bytes."""
-    calculated_crc = binascii.crc32(data) & 0xFFFFFFFF
-    return calculated_crc.to_bytes(4, byteorder="little")
+def _png_is_ready(file_bytes: bytes, target_width: int, target_height: int) -> bool:
+    """Return True if the bytes are an RGB/RGBA PNG already at the target size.
 
+    Only the IHDR chunk is read (width and height at offset 16, color type at
+    offset 25), so such files are sent as-is without being decoded.
+    """
+    if len(file_bytes) < 26 or not file_bytes.startswith(_PNG_SIGNATURE) or file_bytes[12:16] != b"IHDR":
+        return False
+    width, height = struct.unpack(">II", file_bytes[16:24])
+    # Color types 2 (truecolor) and 6 (truecolor with alpha) need no conversion
+    return (width, height) == (target_width, target_height) and file_bytes[25] in (2, 6)
 
-def _len_prefix_for(inner: bytes) -> bytes:
-    """Return 2-byte little-endian prefix matching legacy behavior for ('FFFF' + inner_hex).
+def _read_file_with_crc(path: Path) -> tuple[bytearray, int]:
+    """Read a whole file and compute its CRC32 in the same pass.
 
-    That legacy length was computed over 2 extra bytes (0xFF,0xFF) plus the inner payload.
-    So prefix = (2 + len(inner)).to_bytes(2, 'little')
+    Each chunk is checksummed right after being read, while it is still in
+    the CPU cache, instead of scanning the whole payload again later.
     """
-    return int(2 + len(inner)).to_bytes(2, byteorder="little")
-
-def _load_from_hex_string(hex_string: Union[str, bytes], file_extension: str) -> tuple[bytes, bool]:
+    with open(path, "rb") as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        crc = 0
+        pos = 0
+        with memoryview(data) as view:
+            while pos < len(data):
+                read = f.readinto(view[pos:pos + _READ_CHUNK_SIZE])
+                if not read:
+                    break
+                crc = zlib.crc32(view[pos:pos + read], crc)
+                pos += read
+    # The file may have shrunk since it was stat'ed
+    del data[pos:]
+    return data, crc
+
+def _encode_png(img: Image.Image) -> bytes:
+    """Encode a decoded image as PNG bytes."""
+    output = BytesIO()
+    img.save(output, format="PNG")
+    return output.getvalue()
+
+def _load_from_hex_string(hex_string: Union[str, bytes], file_extension: str, target_size: Optional[tuple[int, int]] = None) -> tuple[Union[bytes, Image.Image], bool]:
     """Load image data from hexadecimal string.
     
     Args:
         hex_string: Hexadecimal representation of image data.
         file_extension: File extension to indicate image type (e.g. '.png', '.jpg', '.gif').
+        target_size: Device size the image will be resized to, if known.
     Returns:
-        Tuple of (file_bytes, is_gif).
+        Tuple of (file_data, is_gif), see `_process_loaded_bytes`.
     """
     if isinstance(hex_string, str):
         hex_string = hex_string.encode("utf-8")
@@ -67,7 +97,7 @@ def _load_from_hex_string(hex_string: Union[str, bytes], file_extension: str) ->
 
     # Normalize extension to start with a dot
     ext = file_extension if file_extension.startswith(".") else f".{file_extension}"
-    return _process_loaded_bytes(file_bytes, ext)
+    return _process_loaded_bytes(file_bytes, ext, target_size)
 
 def _resize_and_crop_image(img: Image.Image, target_width: int, target_height: int) -> Image.Image:
     """Resize and crop image to target dimensions while preserving aspect ratio.
@@ -80,32 +110,27 @@ def _resize_and_crop_image(img: Image.Image, target_width: int, target_height: i
     Returns:
         Resized and cropped PIL Image.
     """
-    # Calculate aspect ratios
-    img_aspect = img.width / img.height
-    target_aspect = target_width / target_height
-    
-    if img_aspect > target_aspect:
+    # Compare aspect ratios with integer cross-multiplication
+    if img.width * target_height > target_width * img.height:
         # Image is wider than target, fit by height and crop width
-        new_height = target_height
-        new_width = int(target_height * img_aspect)
+        crop_width = img.height * target_width / target_height
+        crop_height = img.height
     else:
         # Image is taller than target, fit by width and crop height
-        new_width = target_width
-        new_height = int(target_width / img_aspect)
+        crop_width = img.width
+        crop_height = img.width * target_height / target_width
     
-    # Resize with aspect ratio preserved
-    img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-    
-    # Calculate crop coordinates to center the image
-    left = (new_width - target_width) // 2
-    top = (new_height - target_height) // 2
-    right = left + target_width
-    bottom = top + target_height
-    
-    # Crop to exact target size
-    img_cropped = img_resized.crop((left, top, right, bottom))
+    # Center the crop area in source coordinates
+    left = (img.width - crop_width) / 2
+    top = (img.height - crop_height) / 2
     
-    return img_cropped
+    # Resize only the cropped area, in a single pass: the full-size
+    # intermediate image is never built
+    return img.resize(
+        (target_width, target_height),
+        Image.Resampling.LANCZOS,
+        box=(left, top, left + crop_width, top + crop_height),
+    )
 
 
 def _resize_and_fit_image(img: Image.Image, target_width: int, target_height: int, background_color: tuple = (0, 0, 0)) -> Image.Image:
@@ -120,18 +145,16 @@ def _resize_and_fit_image(img: Image.Image, target_width: int, target_height: in
     Returns:
         Resized and fitted PIL Image with padding.
     """
-    # Calculate aspect ratios
-    img_aspect = img.width / img.height
-    target_aspect = target_width / target_height
-    
-    if img_aspect > target_aspect:
+    # Compare aspect ratios with integer cross-multiplication, and scale
+    # with exact integer arithmetic
+    if img.width * target_height > target_width * img.height:
         # Image is wider than target, fit by width
         new_width = target_width
-        new_height = int(target_width / img_aspect)
+        new_height = target_width * img.height // img.width
     else:
         # Image is taller than target, fit by height
         new_height = target_height
-        new_width = int(target_height * img_aspect)
+        new_width = target_height * img.width // img.height
     
     # Resize with aspect ratio preserved
     img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
@@ -159,11 +182,115 @@ def _resize_and_fit_image(img: Image.Image, target_width: int, target_height: in
     return new_img
 
 
-def _resize_image(file_bytes: bytes, is_gif: bool, target_width: int, target_height: int, fit_mode: ResizeMethod = ResizeMethod.CROP) -> bytes:
+# Application extensions Pillow reads a loop count from
+_GIF_LOOP_EXTENSIONS = (b"\x0bNETSCAPE2.0", b"\x0bANIMEXTS1.0")
+
+
+def _gif_color_table_size(flags: int) -> int:
+    """Return the size in bytes of the color table announced by a GIF flags byte."""
+    return 3 << ((flags & 0x07) + 1) if flags & 0x80 else 0
+
+
+def _gif_skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Return the position following the GIF data sub-blocks starting at pos."""
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def _gif_is_normalized(gif_bytes: bytes) -> bool:
+    """Return True if the GIF already carries the metadata re-encoding would write.
+
+    That is: a loop block before the first frame (a GIF without one plays
+    only once, while re-encoding defaults to looping forever), and for every
+    frame a graphic control extension (which holds the duration) with
+    disposal method 2 (restore to background) and a full-canvas image
+    descriptor. The pixel data and palettes are kept as they are, so the
+    bytes differ from a re-encoded file; only playback is the same.
+
+    The blocks are walked directly in the file data, skipping the image
+    data, so no frame is decoded, and the walk stops at the first frame that
+    differs. Malformed data is reported as not normalized.
+    """
+    try:
+        width, height, flags = struct.unpack_from("<HHB", gif_bytes, 6)
+        pos = 13 + _gif_color_table_size(flags)
+        has_loop = False
+        disposal = None
+        frame_count = 0
+        while True:
+            introducer = gif_bytes[pos]
+            if introducer == 0x3B:  # Trailer
+                return frame_count > 0
+            if introducer == 0x21:  # Extension
+                label = gif_bytes[pos + 1]
+                pos += 2
+                if label == 0xF9 and gif_bytes[pos] == 4:  # Graphic control
+                    disposal = (gif_bytes[pos + 1] >> 2) & 0x07
+                elif label == 0xFF and gif_bytes[pos:pos + 12] in _GIF_LOOP_EXTENSIONS:
+                    has_loop = has_loop or frame_count == 0
+                pos = _gif_skip_sub_blocks(gif_bytes, pos)
+            elif introducer == 0x2C:  # Image descriptor
+                x, y, frame_width, frame_height, flags = struct.unpack_from("<4HB", gif_bytes, pos + 1)
+                if not has_loop or disposal != 2 or (x, y, frame_width, frame_height) != (0, 0, width, height):
+                    return False
+                disposal = None
+                frame_count += 1
+                # Skip the local color table and the LZW code size, then the image data
+                pos += 10 + _gif_color_table_size(flags) + 1
+                pos = _gif_skip_sub_blocks(gif_bytes, pos)
+            else:
+                return False
+    except (IndexError, struct.error):
+        return False
+
+
+def _resize_gif_frame(f: Image.Image, needs_resize: bool, target_width: int, target_height: int, fit_mode: ResizeMethod) -> Image.Image:
+    """Resize a single GIF frame if requested."""
+    if not needs_resize:
+        return f
+    if fit_mode == ResizeMethod.FIT:
+        return _resize_and_fit_image(f, target_width, target_height)
+    elif fit_mode == ResizeMethod.CROP:
+        return _resize_and_crop_image(f, target_width, target_height)
+    else:
+        raise ValueError(f"Unknown fit_mode: {fit_mode}")
+
+
+def _shared_gif_palette(frames: list) -> Optional[Image.Image]:
+    """Compute one adaptive palette for all the RGB frames of an animation.
+
+    The frames are stacked into a single mosaic and quantized once, instead
+    of running a separate median cut for every frame. Returns None when a
+    frame is not plain RGB (e.g. it has transparency), in which case frames
+    are converted one by one.
+    """
+    rgb_frames = [f for f in frames if f.mode not in ('P', 'PA')]
+    if len(rgb_frames) < 2 or any(f.mode != 'RGB' or 'transparency' in f.info for f in rgb_frames):
+        return None
+    width = max(f.width for f in rgb_frames)
+    mosaic = Image.new('RGB', (width, sum(f.height for f in rgb_frames)))
+    y = 0
+    for f in rgb_frames:
+        mosaic.paste(f, (0, y))
+        y += f.height
+    return mosaic.quantize(colors=256, method=_QUANTIZE_METHOD)
+
+
+def _palettize_gif_frame(processed: Image.Image, palette: Optional[Image.Image]) -> Image.Image:
+    """Convert a frame to palette mode ('P') for GIF compatibility."""
+    if processed.mode in ('P', 'PA'):
+        return processed
+    if palette is not None:
+        return processed.quantize(palette=palette, dither=Image.Dither.NONE)
+    return processed.convert('P', palette=Palette.ADAPTIVE, colors=256)
+
+
+def _resize_image(file_bytes: Union[bytes, Image.Image], is_gif: bool, target_width: int, target_height: int, fit_mode: ResizeMethod = ResizeMethod.CROP) -> bytes:
     """Resize image to target dimensions while preserving aspect ratio (with center crop or fit).
     
     Args:
-        file_bytes: Original image data.
+        file_bytes: Original image data, or an already decoded static image.
         is_gif: Whether the image is a GIF.
         target_width: Target width in pixels.
         target_height: Target height in pixels.
@@ -174,7 +301,13 @@ def _resize_image(file_bytes: bytes, is_gif: bool, target_width: int, target_hei
     Returns:
         Resized image data as bytes.
     """
-    img = Image.open(BytesIO(file_bytes))
+    if isinstance(file_bytes, Image.Image):
+        img = file_bytes
+    elif not is_gif and _png_is_ready(file_bytes, target_width, target_height):
+        logger.debug(f"Image already at target size {target_width}x{target_height} and in correct mode")
+        return file_bytes
+    else:
+        img = Image.open(BytesIO(file_bytes))
     
     # Check if resize is needed
     needs_resize = img.size != (target_width, target_height)
@@ -183,10 +316,16 @@ def _resize_image(file_bytes: bytes, is_gif: bool, target_width: int, target_hei
     # Check if conversion from palette mode is needed
     needs_conversion = img.mode in ('P', 'PA', 'L', 'LA')
     
-    # For GIFs we always re-save/re-encode the animation to ensure per-frame
-    # metadata (duration, disposal, palette) is normalized and consistent.
+    # GIFs are re-saved/re-encoded to ensure per-frame metadata (duration,
+    # disposal, palette) is normalized and consistent, unless they already are.
+    if is_gif and not needs_resize and _gif_is_normalized(file_bytes):
+        logger.debug(f"GIF already at target size {target_width}x{target_height} with normalized frames")
+        return file_bytes
+
     if not needs_resize and not needs_conversion and not is_gif:
         logger.debug(f"Image already at target size {target_width}x{target_height} and in correct mode")
+        if isinstance(file_bytes, Image.Image):
+            return _encode_png(img)
         return file_bytes
     
     if needs_resize:
@@ -200,39 +339,39 @@ def _resize_image(file_bytes: bytes, is_gif: bool, target_width: int, target_hei
         # Always re-encode GIFs by iterating per-frame. Use per-frame
         # `frame.info` (falls back to `img.info`) to collect accurate
         # durations and disposal methods.
-        frames = []
+        # Frames are decoded sequentially (GIF frames build on each other),
+        # then resized and quantized in parallel: Pillow releases the GIL
+        # while resampling and quantizing.
+        source_frames = []
         durations = []
         disposal_methods = []
 
         for frame in ImageSequence.Iterator(img):
             f = frame.copy()
-
-            # Resize frame if requested
-            if needs_resize:
-                if fit_mode == ResizeMethod.FIT:
-                    processed = _resize_and_fit_image(f, target_width, target_height)
-                elif fit_mode == ResizeMethod.CROP:
-                    processed = _resize_and_crop_image(f, target_width, target_height)
-                else:
-                    raise ValueError(f"Unknown fit_mode: {fit_mode}")
-            else:
-                processed = f
-
-            # Convert to palette mode ('P') for GIF compatibility. If the
-            # frame has transparency, convert via RGBA to preserve alpha.
-            if processed.mode in ('P', 'PA'):
-                pframe = processed
-            elif processed.mode in ('RGBA', 'LA') or 'transparency' in f.info:
-                pframe = processed.convert('P', palette=Palette.ADAPTIVE, colors=256)
-            else:
-                pframe = processed.convert('P', palette=Palette.ADAPTIVE, colors=256)
-
-            frames.append(pframe)
+            source_frames.append(f)
 
             # Prefer per-frame info, fallback to global img.info
             durations.append(f.info.get('duration', img.info.get('duration', 100)))
             disposal_methods.append(f.info.get('disposal', img.info.get('disposal', 2)))
 
+        def resize_frame(f: Image.Image) -> Image.Image:
+            return _resize_gif_frame(f, needs_resize, target_width, target_height, fit_mode)
+
+        max_workers = min(os.cpu_count() or 1, len(source_frames))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Single-CPU hosts map sequentially, without the pool overhead
+            map_frames = executor.map if max_workers > 1 else map
+            resized_frames = list(map_frames(resize_frame, source_frames))
+
+            # All frames share one palette when possible, which also keeps
+            # colors stable from one frame to the next
+            palette = _shared_gif_palette(resized_frames)
+
+            def palettize_frame(f: Image.Image) -> Image.Image:
+                return _palettize_gif_frame(f, palette)
+
+            frames = list(map_frames(palettize_frame, resized_frames))
+
         frame_count = len(frames)
         logger.info(f"Processing {frame_count} frames for animated GIF")
 
@@ -287,17 +426,18 @@ def _resize_image(file_bytes: bytes, is_gif: bool, target_width: int, target_hei
             resized_img = img
         # Convert to RGB to remove palette (P mode) and ensure compatibility
         resized_img = resized_img.convert('RGB')
-        output = BytesIO()
-        resized_img.save(output, format='PNG')
-        
-        return output.getvalue()
+        return _encode_png(resized_img)
 
-def _process_loaded_bytes(file_bytes: bytes, extension: str) -> tuple[bytes, bool]:
-    """Process raw file bytes according to extension and return (bytes, is_gif).
+def _process_loaded_bytes(file_bytes: bytes, extension: str, target_size: Optional[tuple[int, int]] = None) -> tuple[Union[bytes, Image.Image], bool]:
+    """Process raw file bytes according to extension and return (file_data, is_gif).
 
     This centralizes conversion logic used by both file-based and hex-based
     loaders. If the extension indicates a format that needs conversion (JPEG,
-    WEBP, HEIC/HEIF, etc.) we convert it to PNG and return the PNG bytes.
+    WEBP, HEIC/HEIF, etc.) the decoded image is returned instead of bytes, so
+    that it is encoded to PNG only once, after resizing (see `_resize_image`).
+
+    When target_size is given, JPEGs are decoded directly at a reduced scale
+    that is still at least that size, which is much faster for large photos.
     """
     ext = extension.lower()
     is_gif = ext == ".gif"
@@ -313,49 +453,28 @@ def _process_loaded_bytes(file_bytes: bytes, extension: str) -> tuple[bytes, boo
 
         logger.info(f"Converting image from {ext} to PNG format")
         img = Image.open(BytesIO(file_bytes))
-        output = BytesIO()
-        img.save(output, format="PNG")
-        file_bytes = output.getvalue()
+        if target_size is not None:
+            # Only JPEG supports this (DCT scaling), other formats ignore it
+            img.draft(None, target_size)
+        img.load()
+        return img, is_gif
 
     return file_bytes, is_gif
 
-def _build_send_plan(file_bytes: bytes, is_gif: bool, plan_name: str = "send_image", save_slot: int = 0) -> SendPlan:
+def _build_send_plan(file_bytes: bytes, is_gif: bool, plan_name: str = "send_image", save_slot: int = 0, crc: Optional[int] = None) -> SendPlan:
     """
     Build a SendPlan by splitting file_bytes into windows.
 
     plan_name: name to use when constructing the SendPlan (keeps parity with
     previous APIs where hex vs file used slightly different plan names).
     save_slot: if >= 1, will save to that slot.
+    crc: CRC32 of file_bytes if already known (e.g. computed while reading).
     """
-    size_bytes = _frame_size_bytes(len(file_bytes), 8)  # 4 bytes little-endian
-    crc_bytes = _crc32_le(file_bytes)  # 4 bytes little-endian
-    payload = file_bytes
-
-    windows = []
-    window_size = 12 * 1024
-    pos = 0
-    window_index = 0
-    while pos < len(payload):
-        window_end = min(pos + window_size, len(payload))
-        chunk_payload = payload[pos:window_end]
-
-        option = 0x00 if window_index == 0 else 0x02
-
-        if is_gif:
-            cur_tail = bytes([0x02, save_slot])
-            header = bytes([0x03, 0x00, option]) + size_bytes + crc_bytes + cur_tail
-        else:
-            cur_tail = bytes([0x00, save_slot])
-            header = bytes([0x02, 0x00, option]) + size_bytes + crc_bytes + cur_tail
-
-        frame = header + chunk_payload
-        prefix = _len_prefix_for(frame)
-        message = prefix + frame
-        windows.append(Window(data=message, requires_ack=True))
-
-        window_index += 1
-        pos = window_end
-
+    # Type 0x03 for GIF and 0x02 for PNG, then the tail byte and save slot
+    if is_gif:
+        windows = build_windows(file_bytes, bytes([0x03, 0x00]), bytes([0x02, save_slot]), crc=crc)
+    else:
+        windows = build_windows(file_bytes, bytes([0x02, 0x00]), bytes([0x00, save_slot]), crc=crc)
     return SendPlan(plan_name, windows)
 
 
@@ -387,9 +506,9 @@ def send_image(path: Union[str, Path], resize_method: Union[str, ResizeMethod] =
     
     # Load image data
     if path.exists() and path.is_file():
-        with open(path, "rb") as f:
-            file_bytes = f.read()
-        file_bytes, is_gif = _process_loaded_bytes(file_bytes, path.suffix.lower())
+        raw_bytes, raw_crc = _read_file_with_crc(path)
+        target_size = (device_info.width, device_info.height) if device_info is not None else None
+        file_bytes, is_gif = _process_loaded_bytes(raw_bytes, path.suffix.lower(), target_size)
     else:
         raise ValueError(f"File not found: {path}")
 
@@ -398,8 +517,12 @@ def send_image(path: Union[str, Path], resize_method: Union[str, ResizeMethod] =
         file_bytes = _resize_image(file_bytes, is_gif, device_info.width, device_info.height, resize_method)
     else:
         logger.warning("Device info not provided; skipping image resizing.")
+        if isinstance(file_bytes, Image.Image):
+            file_bytes = _encode_png(file_bytes)
 
-    return _build_send_plan(file_bytes, is_gif, plan_name="send_image", save_slot=save_slot)
+    # Reuse the CRC computed while reading when the file is sent unchanged
+    crc = raw_crc if file_bytes is raw_bytes else None
+    return _build_send_plan(file_bytes, is_gif, plan_name="send_image", save_slot=save_slot, crc=crc)
 
 
 def send_image_hex(hex_string: Union[str, bytes], file_extension: str, resize_method: Union[str, ResizeMethod] = ResizeMethod.CROP, device_info: Optional[DeviceInfo] = None, save_slot: int = 0):
@@ -420,12 +543,15 @@ def send_image_hex(hex_string: Union[str, bytes], file_extension: str, resize_me
         resize_method = ResizeMethod(resize_method)
     
     # Load image data from hex string
-    file_bytes, is_gif = _load_from_hex_string(hex_string, file_extension)
+    target_size = (device_info.width, device_info.height) if device_info is not None else None
+    file_bytes, is_gif = _load_from_hex_string(hex_string, file_extension, target_size)
 
     # Resize image if device_info is available
     if device_info is not None:
         file_bytes = _resize_image(file_bytes, is_gif, device_info.width, device_info.height, resize_method)
     else:
         logger.warning("Device info not provided; skipping image resizing.")
+        if isinstance(file_bytes, Image.Image):
+            file_bytes = _encode_png(file_bytes)
 
     return _build_send_plan(file_bytes, is_gif, plan_name="send_image_hex", save_slot=save_slot)
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """Text command module with support for emojis and variable-width rendering."""
 
-import binascii
 from typing import Optional, Union
 from logging import getLogger
 
-from ...lib.transport.send_plan import SendPlan, Window
+from ...lib.transport.send_plan import SendPlan
+from ...lib.transport.window import build_windows
 from ...lib.device_info import DeviceInfo
 from ...lib.font_config import FontConfig
 
@@ -104,12 +104,12 @@ def send_text(text: str,
     #########################
 
     properties = bytearray()
-    properties += bytes([
+    properties.extend([
         0x00,   # Reserved
         0x01,   # Reserved
         0x01    # Reserved
     ])
-    properties += bytes([
+    properties.extend([
         int(animation) & 0xFF,      # Animation
         int(speed) & 0xFF,          # Speed
         int(rainbow_mode) & 0xFF    # Rainbow mode
@@ -124,11 +124,11 @@ def send_text(text: str,
             raise ValueError(f"Invalid background color hex: {bg_color}")
         if len(bg_color_bytes) != 3:
             raise ValueError("Background color must be 3 bytes (6 hex chars), e.g. 'ff0000'")
-        properties += bytes([0x01])  # Enable background
+        properties.append(0x01)  # Enable background
         properties += bg_color_bytes
         logger.info(f"Background color enabled: #{bg_color}")
     else:
-        properties += bytes([
+        properties.extend([
             0x00,   # Background disabled
             0x00,   # R (unused)
             0x00,   # G (unused)
@@ -147,7 +147,7 @@ def send_text(text: str,
         characters_bytes, num_chars = encode_text_chunked(
             text,
             char_height,
-            color,
+            color_bytes,
             font_config.path,
             font_offset,
             font_size,
@@ -160,7 +160,7 @@ def send_text(text: str,
         characters_bytes = encode_text(
             text,
             char_height,
-            color,
+            color_bytes,
             font_config.path,
             font_offset,
             font_size,
@@ -172,64 +172,22 @@ def send_text(text: str,
         num_chars = len(text)
 
     # Build data payload with character count
-    data_payload = bytes([num_chars]) + properties + characters_bytes
-
-    #########################
-    #        CHECKSUM       #
-    #########################
-
-    crc = binascii.crc32(data_payload) & 0xFFFFFFFF
-    payload_size = len(data_payload)
+    data_payload = bytearray()
+    data_payload.append(num_chars)
+    data_payload += properties
+    data_payload += characters_bytes
 
     #########################
     #      MULTI-FRAME      #
     #########################
 
-    windows = []
-    window_size = 12 * 1024
-    pos = 0
-    window_index = 0
-    
-    while pos < payload_size:
-        window_end = min(pos + window_size, payload_size)
-        chunk_payload = data_payload[pos:window_end]
-        
-        # Option: 0x00 for first frame, 0x02 for subsequent frames
-        option = 0x00 if window_index == 0 else 0x02
-        
-        # Construct header for this frame
-        # [00 01 Option] [Payload Size (4)] [CRC (4)] [00 SaveSlot]
-        
-        frame_header = bytearray()
-        frame_header += bytes([
-            0x00,   # Reserved
-            0x01,   # Command
-            option  # Option
-        ])
-        
-        # Payload Size (Total) - 4 bytes little endian
-        frame_header += payload_size.to_bytes(4, byteorder="little")
-        
-        # CRC - 4 bytes little endian
-        frame_header += crc.to_bytes(4, byteorder="little")
-        
-        # Tail - 2 bytes
-        frame_header += bytes([0x00])                   # Reserved
-        frame_header += bytes([int(save_slot) & 0xFF])  # save_slot
-        
-        # Combine header and chunk
-        frame_content = frame_header + chunk_payload
-        
-        # Calculate frame length prefix
-        # Total size = len(frame_content) + 2 (for the prefix itself)
-        frame_len = len(frame_content) + 2
-        prefix = frame_len.to_bytes(2, byteorder="little")
-        
-        message = prefix + frame_content
-        windows.append(Window(data=message, requires_ack=True))
-        
-        window_index += 1
-        pos = window_end
+    # [00 01 Option] [Payload Size (4)] [CRC (4)] [00 SaveSlot], the CRC
+    # being computed over the whole payload by build_windows
+    windows = build_windows(
+        data_payload,
+        bytes([0x00, 0x01]),                    # Reserved, Command
+        bytes([0x00, int(save_slot) & 0xFF])    # Reserved, save_slot
+    )
 
     logger.info(f"Split text into {len(windows)} frames")
     return SendPlan("send_text", windows)
@@ -2,6 +2,7 @@
 """Text encoding logic for character and emoji blocks."""
 
 from logging import getLogger
+from typing import Optional
 
 from ...lib.emoji_manager import is_emoji
 from .models import SegmentType, TextSegment
@@ -12,6 +13,10 @@ from .image_processing import (
 logger = getLogger(__name__)
 
 
+# Translation table mapping every byte value to its bit-reversed value
+_BITREV8 = bytes(int(f"{b:08b}"[::-1], 2) for b in range(256))
+
+
 def _logic_reverse_bits_order_bytes(data: bytes) -> bytes:
     """Reverse the bit order in each byte independently.
     
@@ -21,14 +26,7 @@ def _logic_reverse_bits_order_bytes(data: bytes) -> bytes:
     Returns:
         Bytes with bit order reversed in each byte
     """
-    result = bytearray()
-    for byte in data:
-        reversed_byte = 0
-        for i in range(8):
-            if (byte >> i) & 1:
-                reversed_byte |= 1 << (7 - i)
-        result.append(reversed_byte)
-    return bytes(result)
+    return bytes(data).translate(_BITREV8)
 
 
 def encode_emoji_block(emoji_bytes: bytes, text_size: int) -> bytes:
@@ -44,13 +42,13 @@ def encode_emoji_block(emoji_bytes: bytes, text_size: int) -> bytes:
     result = bytearray()
     
     if text_size == 32:
-        result += bytes([0x09])  # Emoji 32x32
+        result.append(0x09)  # Emoji 32x32
         result += len(emoji_bytes).to_bytes(2, byteorder='little')  # Payload size
-        result += bytes([0x00])  # Reserved
+        result.append(0x00)  # Reserved
     else:  # text_size == 16
-        result += bytes([0x08])  # Emoji 16x16 (JPEG format)
+        result.append(0x08)  # Emoji 16x16 (JPEG format)
         result += len(emoji_bytes).to_bytes(2, byteorder='little')  # Payload size
-        result += bytes([0x00])  # Reserved
+        result.append(0x00)  # Reserved
     
     result += emoji_bytes
     return bytes(result)
@@ -70,17 +68,17 @@ def encode_character_block(char_bytes: bytes, text_size: int, color_bytes: bytes
     result = bytearray()
 
     if text_size == 32:
-        result += bytes([0x02])  # Char 32x16
+        result.append(0x02)  # Char 32x16
         result += color_bytes
     else:  # text_size == 16
-        result += bytes([0x00])  # Char 16x8
+        result.append(0x00)  # Char 16x8
         result += color_bytes
 
     result += char_bytes
     return bytes(result)
 
 
-def encode_text_chunked(text: str, char_height: int, color: str, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int, chunk_width: int, reverse: bool = False) -> tuple[bytes, int]:
+def encode_text_chunked(text: str, char_height: int, color_bytes: bytes, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int, chunk_width: int, reverse: bool = False) -> tuple[bytes, int]:
     """Encode text with variable width chunks, handling both regular text and emojis.
     
     This function processes text segment by segment:
@@ -90,7 +88,7 @@ def encode_text_chunked(text: str, char_height: int, color: str, font_path: str,
     Args:
         text (str): The text to encode.
         char_height (int): The height of the character used for rendering.
-        color (str): The color in hex format (e.g., 'ffffff').
+        color_bytes (bytes): The validated RGB color bytes.
         font_path (str): Path to the font file.
         font_offset (tuple[int, int]): The (x, y) offset for the font.
         font_size (int): The font size for rendering.
@@ -101,15 +99,6 @@ def encode_text_chunked(text: str, char_height: int, color: str, font_path: str,
     Returns:
         tuple: (encoded_bytes, num_items) where num_items is the count of chunks and emojis generated.
     """
-    # Convert color to bytes
-    try:
-        color_bytes = bytes.fromhex(color)
-    except Exception:
-        raise ValueError(f"Invalid color hex: {color}")
-    
-    if len(color_bytes) != 3:
-        raise ValueError("Color must be 3 bytes (6 hex chars), e.g. 'ffffff'")
-    
     items = []  
     segments: list[TextSegment] = []
     current_text = ""
@@ -168,13 +157,13 @@ def encode_text_chunked(text: str, char_height: int, color: str, font_path: str,
     return bytes(result), len(items)
 
 
-def encode_text(text: str, matrix_height: int, color: str, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int, reverse: bool = False) -> bytes:
+def encode_text(text: str, matrix_height: int, color_bytes: bytes, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int, reverse: bool = False) -> bytes:
     """Encode text to be displayed on the device.
 
     Args:
         text (str): The text to encode.
         matrix_height (int): The height of the LED matrix.
-        color (str): The color in hex format (e.g., 'ffffff').
+        color_bytes (bytes): The validated RGB color bytes.
         font_path (str): Path to the font file.
         font_offset (tuple[int, int]): The (x, y) offset for the font.
         font_size (int): The font size for rendering.
@@ -186,16 +175,6 @@ def encode_text(text: str, matrix_height: int, color: str, font_path: str, font_
     """
     result = bytearray()
 
-    # Convert color to bytes
-    try:
-        color_bytes = bytes.fromhex(color)
-    except Exception:
-        raise ValueError(f"Invalid color hex: {color}")
-    
-    # Validate color length
-    if len(color_bytes) != 3:
-        raise ValueError("Color must be 3 bytes (6 hex chars), e.g. 'ffffff'")
-
     # Reverse text if requested
     text_to_process = text[::-1] if reverse else text
 
@@ -203,19 +182,28 @@ def encode_text(text: str, matrix_height: int, color: str, font_path: str, font_
     # Processing #
     ##############
 
+    # Encoded block of each distinct character (None if it failed to encode)
+    blocks: dict[str, Optional[bytes]] = {}
+
     for char in text_to_process:
-        if is_emoji(char):
+        if char in blocks:
+            block = blocks[char]
+        elif is_emoji(char):
             char_bytes = emoji_to_hex(char, matrix_height)
-            if char_bytes:
-                result += encode_emoji_block(char_bytes, matrix_height)
-            else:
-                logger.error(f"Failed to encode emoji: {char}")
+            block = blocks[char] = encode_emoji_block(char_bytes, matrix_height) if char_bytes else None
         else:
             char_bytes = char_to_hex(char, matrix_height, font_path, font_offset, font_size, pixel_threshold)
             if char_bytes:
                 char_bytes = _logic_reverse_bits_order_bytes(char_bytes)
-                result += encode_character_block(char_bytes, matrix_height, color_bytes)
+                block = blocks[char] = encode_character_block(char_bytes, matrix_height, color_bytes)
             else:
-                logger.error(f"Failed to encode character: {char}")
+                block = blocks[char] = None
+
+        if block is not None:
+            result += block
+        elif is_emoji(char):
+            logger.error(f"Failed to encode emoji: {char}")
+        else:
+            logger.error(f"Failed to encode character: {char}")
 
     return bytes(result)
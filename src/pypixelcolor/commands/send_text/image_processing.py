@@ -1,16 +1,29 @@
 # -*- coding: utf-8 -*-
 """Image processing utilities for text rendering."""
 
+from functools import lru_cache
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
-from logging import getLogger
+from logging import DEBUG, getLogger
 
 from ...lib.emoji_manager import get_emoji_image
 
 logger = getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, parsing each (path, size) pair only once."""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=None)
+def _threshold_lut(threshold: int) -> tuple[int, ...]:
+    """Point table mapping grayscale levels above threshold to 255, others to 0."""
+    return tuple(255 if p > threshold else 0 for p in range(256))
+
+
 def apply_pixel_threshold(img: Image.Image, threshold: int) -> Image.Image:
     """Apply threshold to convert grayscale image to binary.
     
@@ -21,10 +34,7 @@ def apply_pixel_threshold(img: Image.Image, threshold: int) -> Image.Image:
     Returns:
         Image.Image: Binary image (black/white only).
     """
-    def _threshold_func(p: int) -> int:
-        return 255 if p > threshold else 0
-    
-    return img.point(_threshold_func, mode='L')
+    return img.point(_threshold_lut(threshold), mode='L')
 
 
 def create_text_image(text: str, height: int, font_path: str, 
@@ -49,7 +59,7 @@ def create_text_image(text: str, height: int, font_path: str,
     """
     img = Image.new('L', (1000, height), 0)
     draw = ImageDraw.Draw(img)
-    font_obj = ImageFont.truetype(font_path, font_size)
+    font_obj = _load_font(font_path, font_size)
     
     # Draw text
     draw.text(offset, text, fill=255, font=font_obj)
@@ -87,60 +97,35 @@ def render_text_segment_to_chunks(text: str, height: int, font_path: str,
     return split_image_into_chunks(img, chunk_width)
 
 
+# Point table mapping every lit grayscale level to 1 when converting to mode "1"
+_NONZERO_TO_1BIT = [0] + [255] * 255
+
+
 def encode_char_img(img: Image.Image) -> bytes:
     """
     Convert a character image to a bytes representation (one line after another).
 
+    Each line is packed MSB first (leftmost pixel in the highest bit) into
+    ceil(width / 8) bytes, any non-zero pixel being lit. This is the raw
+    layout of a Pillow mode "1" image, so the packing is done by Pillow.
+
     Returns:
         bytes: Encoded byte data of the character image.
     """
 
-    # Load the image in grayscale and get dimensions
+    # Load the image in grayscale and pack it to 1 bit per pixel
     img = img.convert("L")
     char_width, char_height = img.size
+    data_bytes = img.point(_NONZERO_TO_1BIT, mode="1").tobytes()
 
-    if img.size != (char_width, char_height):
-        raise ValueError("The image must be " + str(char_width) + "x" + str(char_height) + " pixels")
-
-    data_bytes = bytearray()
-    logger.debug("=" * char_width + " %i" % char_width)
-
-    for y in range(char_height):
-        line_value = 0
-        line_value_2 = 0
-
-        for x in range(char_width):
-            pixel = img.getpixel((x, y))
-            if pixel > 0:  # type: ignore
-                if x < 16:
-                    line_value |= (1 << (15 - x))
-                else:
-                    line_value_2 |= (1 << (31 - x))
-
-        # Merge line_value_2 into line_value for 32-bit value
-        line_value = (line_value_2) | (line_value << 16) if char_width > 16 else line_value
-
-        # Build the line bytes (big-endian) according to width
-        if char_width <= 8:
-            line_value >>= 8
-            byte_len = 1
-            binary_str = f"{line_value:0{8}b}".replace('0', '.').replace('1', '#')
-        elif char_width <= 16:
-            byte_len = 2
-            binary_str = f"{line_value:0{16}b}".replace('0', '.').replace('1', '#')
-        elif char_width <= 24:
-            line_value >>= 8
-            byte_len = 3
-            binary_str = f"{line_value:0{24}b}".replace('0', '.').replace('1', '#')
-        else:
-            byte_len = 4
-            binary_str = f"{line_value:0{32}b}".replace('0', '.').replace('1', '#')
-
-        logger.debug(binary_str)
-
-        data_bytes += line_value.to_bytes(byte_len, byteorder='big')
+    if logger.isEnabledFor(DEBUG):
+        byte_len = (char_width + 7) // 8
+        logger.debug("=" * char_width + " %i" % char_width)
+        for y in range(char_height):
+            line = data_bytes[y * byte_len:(y + 1) * byte_len]
+            logger.debug(f"{int.from_bytes(line, 'big'):0{byte_len * 8}b}".replace('0', '.').replace('1', '#'))
 
-    return bytes(data_bytes)
+    return data_bytes
 
 
 def emoji_to_hex(emoji: str, emoji_height: int) -> Optional[bytes]:
@@ -181,9 +166,44 @@ def emoji_to_hex(emoji: str, emoji_height: int) -> Optional[bytes]:
         return None
 
 
+@lru_cache(maxsize=512)
+def _render_char(character: str, char_height: int, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int) -> bytes:
+    """Render a character to its bitmap bytes, once per distinct set of arguments."""
+    # Generate image with dynamic width
+    font_obj = _load_font(font_path, font_size)
+
+    # Get text bounding box (same as ImageDraw.textbbox at (0, 0), without a scratch image)
+    bbox = font_obj.getbbox(character)
+    text_width = bbox[2] - bbox[0]
+
+    # Clamp text_width between min and max values to prevent crash
+    if char_height == 32:
+        min_width = 9
+        max_width = 16
+    else:
+        min_width = 1
+        max_width = 8
+    text_width = int(max(min_width, min(text_width, max_width)))
+
+    # Create final image in grayscale mode for pixel-perfect rendering
+    img = Image.new('L', (int(text_width), int(char_height)), 0)
+    d = ImageDraw.Draw(img)
+
+    # Draw text in white (255) for pixel-perfect rendering
+    d.text(font_offset, character, fill=255, font=font_obj)
+
+    # Apply threshold for pixel-perfect conversion
+    img = apply_pixel_threshold(img, pixel_threshold)
+
+    return encode_char_img(img)
+
+
 def char_to_hex(character: str, char_height: int, font_path: str, font_offset: tuple[int, int], font_size: int, pixel_threshold: int) -> Optional[bytes]:
     """Convert a character to its bitmap bytes.
     
+    Bitmaps are cached, so a character repeated in a text (or across texts
+    using the same font settings) is only rendered once.
+    
     Args:
         character (str): The character to convert.
         char_height (int): The size of the text (height of the matrix).
@@ -196,37 +216,7 @@ def char_to_hex(character: str, char_height: int, font_path: str, font_offset: t
         Optional[bytes]: Encoded bitmap bytes of the character, or None if conversion fails.
     """
     try:
-        # Generate image with dynamic width
-        # First, create a temporary large image to measure text in grayscale
-        temp_img = Image.new('L', (100, char_height), 0)
-        temp_draw = ImageDraw.Draw(temp_img)
-        font_obj = ImageFont.truetype(font_path, font_size)
-        
-        # Get text bounding box
-        bbox = temp_draw.textbbox((0, 0), character, font=font_obj)
-        text_width = bbox[2] - bbox[0]
-
-        # Clamp text_width between min and max values to prevent crash
-        if char_height == 32:
-            min_width = 9
-            max_width = 16
-        else:
-            min_width = 1
-            max_width = 8
-        text_width = int(max(min_width, min(text_width, max_width)))
-
-        # Create final image in grayscale mode for pixel-perfect rendering
-        img = Image.new('L', (int(text_width), int(char_height)), 0)
-        d = ImageDraw.Draw(img)
-        
-        # Draw text in white (255) for pixel-perfect rendering
-        d.text(font_offset, character, fill=255, font=font_obj)
-
-        # Apply threshold for pixel-perfect conversion
-        img = apply_pixel_threshold(img, pixel_threshold)
-
-        bytes_data = encode_char_img(img)
-        return bytes_data
+        return _render_char(character, char_height, font_path, tuple(font_offset), font_size, pixel_threshold)
     except Exception as e:
         logger.error(f"Error occurred while converting character to hex: {e}")
         return None
@@ -259,9 +249,10 @@ def split_image_into_chunks(img: Image.Image, chunk_width: int) -> list[Image.Im
             # Paste the actual chunk on the left side
             padded_chunk.paste(chunk, (0, 0))
             chunk = padded_chunk
-            logger.debug(f"Created chunk {len(chunks)}: {actual_width}x{height} pixels (padded to {chunk_width}x{height}) at x={x}")
+            logger.debug("Created chunk %i: %ix%i pixels (padded to %ix%i) at x=%i",
+                         len(chunks), actual_width, height, chunk_width, height, x)
         else:
-            logger.debug(f"Created chunk {len(chunks)}: {actual_width}x{height} pixels at x={x}")
+            logger.debug("Created chunk %i: %ix%i pixels at x=%i", len(chunks), actual_width, height, x)
 
         chunks.append(chunk)
 
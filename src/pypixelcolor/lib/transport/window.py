@@ -1,6 +1,76 @@
+import struct
+import zlib
 from dataclasses import dataclass
+from typing import Optional, Union
 
 @dataclass
 class Window:
-    data: bytes
+    data: Union[bytes, memoryview]
     requires_ack: bool = True
+
+
+# Window framing, little-endian:
+# [Frame length (2)] [Type, Command (2)] [Option] [Payload size (4)] [CRC (4)] [Tail (2)]
+# The frame length counts the whole frame, including its own 2 bytes.
+_FRAME_HEADER = struct.Struct("<H2sBII2s")
+
+# Option byte of the first window and of the following ones
+_OPTION_FIRST = 0x00
+_OPTION_NEXT = 0x02
+
+
+def build_windows(payload: Union[bytes, bytearray],
+                  command: bytes,
+                  tail: bytes,
+                  crc: Optional[int] = None,
+                  window_size: int = 12 * 1024) -> list[Window]:
+    """Split a payload into framed windows.
+
+    Each window carries the 15-byte frame header above followed by up to
+    window_size bytes of the payload; the size and CRC fields describe the
+    whole payload, not the window.
+
+    Args:
+        payload: Data to send.
+        command: The 2 bytes following the length prefix (e.g. b"\\x02\\x00" for a PNG).
+        tail: The 2 bytes closing the header (e.g. bytes([0x00, save_slot])).
+        crc: CRC32 of the payload if already known (computed otherwise).
+        window_size: Maximum number of payload bytes per window.
+
+    Returns:
+        list[Window]: Windows in send order, each requiring an ACK.
+    """
+    if crc is None:
+        # zlib's crc32 is the vectorized implementation and releases the GIL on
+        # large buffers; binascii only uses it when CPython was built against zlib
+        crc = zlib.crc32(payload)
+    payload_length = len(payload)
+    window_count = -(-payload_length // window_size)
+
+    # All windows are packed into one preallocated buffer, so the payload is
+    # copied once and no header or window bytes objects are concatenated.
+    # Each Window holds a read-only view of its slice of that buffer.
+    buffer = bytearray(payload_length + window_count * _FRAME_HEADER.size)
+    view = memoryview(buffer)
+    source = memoryview(payload)
+
+    windows = []
+    offset = 0
+    for pos in range(0, payload_length, window_size):
+        chunk_length = min(window_size, payload_length - pos)
+        start = offset
+        _FRAME_HEADER.pack_into(
+            buffer, offset,
+            _FRAME_HEADER.size + chunk_length,
+            command,
+            _OPTION_FIRST if pos == 0 else _OPTION_NEXT,
+            payload_length,
+            crc,
+            tail,
+        )
+        offset += _FRAME_HEADER.size
+        view[offset:offset + chunk_length] = source[pos:pos + chunk_length]
+        offset += chunk_length
+        windows.append(Window(data=view[start:offset].toreadonly(), requires_ack=True))
+
+    return windows
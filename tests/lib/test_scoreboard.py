@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pytest to validate `set_sb_score` renders defined in `tests/resources/set_sb_score.json`."""
+import json
+import sys
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+# Ensure project src is importable
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pypixelcolor.commands.scoreboard import set_sb_score
+from pypixelcolor.lib.device_info import DeviceInfo, DEVICE_TYPE_MAP, LED_SIZE_MAP
+
+# Length prefix (2) + image header (13) in front of each window payload
+_WINDOW_HEADER_SIZE = 15
+
+
+def lib_test_set_sb_score_renders(file_name: str):
+    resource = Path(__file__).parent.parent / "resources" / file_name
+    with resource.open("r", encoding="utf-8") as fh:
+        data = json.load(fh)
+
+    for case in data.get("tests", []):
+        name = case.get("name", "<unnamed>")
+        args = case.get("args", {}) or {}
+
+        device_type = case["device_type"]
+        led_type = DEVICE_TYPE_MAP.get(device_type, 0)
+        width, height = LED_SIZE_MAP.get(led_type, (64, 64))
+        device_info = DeviceInfo(
+            device_type=int(device_type),
+            mcu_version="unknown",
+            wifi_version="unknown",
+            width=width,
+            height=height,
+            has_wifi=False,
+            password_flag=255,
+            led_type=led_type,
+        )
+
+        plan = set_sb_score(device_info=device_info, **args)
+        windows = list(plan.windows)
+        assert len(windows) > 0, f"{name}: plan.windows is empty"
+
+        # Reassemble the PNG and compare decoded pixels, so the test does not
+        # depend on the PNG encoder settings.
+        png_bytes = b"".join(bytes(win.data[_WINDOW_HEADER_SIZE:]) for win in windows)
+        img = Image.open(BytesIO(png_bytes)).convert("RGB")
+        assert img.size == (width, height), f"{name}: unexpected size {img.size}"
+
+        colors = {letter: tuple(bytes.fromhex(value)) for letter, value in case["legend"].items()}
+        colors["."] = (0, 0, 0)
+        expected = [[colors[ch] for ch in row] for row in case["expected_pixels"]]
+        actual = [[img.getpixel((x, y)) for x in range(width)] for y in range(height)]
+        for y, (actual_row, expected_row) in enumerate(zip(actual, expected)):
+            assert actual_row == expected_row, f"{name}: pixel mismatch on row {y}"
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Helpers to validate `_build_send_plan` windows and GIF normalization in `_resize_image`."""
+import json
+import sys
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageFile, ImageSequence
+
+# Ensure project src is importable
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pypixelcolor.commands.send_image import _build_send_plan, _gif_is_normalized, _resize_image
+
+# Length prefix (2) + image header (13) in front of each window payload
+_WINDOW_HEADER_SIZE = 15
+
+
+def _pattern_payload(length: int) -> bytes:
+    """Deterministic payload of the given length (0x00..0xFF repeated)."""
+    return (bytes(range(256)) * (length // 256 + 1))[:length]
+
+
+def lib_test_build_send_plan_windows(file_name: str):
+    resource = Path(__file__).parent.parent / "resources" / file_name
+    with resource.open("r", encoding="utf-8") as fh:
+        data = json.load(fh)
+
+    for case in data.get("tests", []):
+        name = case.get("name", "<unnamed>")
+        args = case.get("args", {}) or {}
+
+        payload = _pattern_payload(case["payload_length"])
+        plan = _build_send_plan(payload, **args)
+        windows = list(plan.windows)
+
+        # Headers (length prefix + image header) of every window
+        expected_headers = case["expected_headers"]
+        assert len(windows) == len(expected_headers), f"{name}: window count mismatch"
+        for idx, (win, expected) in enumerate(zip(windows, expected_headers)):
+            actual_hex = bytes(win.data[:_WINDOW_HEADER_SIZE]).hex()
+            assert actual_hex == expected, f"{name}: header mismatch in window {idx}\nactual:   {actual_hex}\nexpected: {expected}"
+            assert win.requires_ack, f"{name}: window {idx} does not require an ACK"
+
+        # Window payloads must add up to the original data
+        joined = b"".join(bytes(win.data[_WINDOW_HEADER_SIZE:]) for win in windows)
+        assert joined == payload, f"{name}: reassembled payload mismatch"
+
+
+def _normalized_gif(size: tuple[int, int], frame_count: int = 3, disposal=2, **save_args) -> bytes:
+    """GIF with explicit durations and full-canvas frames (disposal 2 by default) at the given size."""
+    frames = [Image.new("RGB", size, (i * 30, 0, 255 - i * 30)) for i in range(frame_count)]
+    output = BytesIO()
+    frames[0].save(output, format="GIF", save_all=True, append_images=frames[1:],
+                   duration=100, disposal=disposal, **save_args)
+    return output.getvalue()
+
+
+def _gif_disposals(gif_bytes: bytes) -> list[int]:
+    """Disposal method of every frame of a GIF."""
+    return [frame.disposal_method for frame in ImageSequence.Iterator(Image.open(BytesIO(gif_bytes)))]
+
+
+def lib_test_gif_loop_is_kept(size: tuple[int, int]):
+    # Without a loop block the GIF would play once: it must be re-encoded to loop forever
+    gif_bytes = _normalized_gif(size)
+    assert "loop" not in Image.open(BytesIO(gif_bytes)).info
+    output = _resize_image(gif_bytes, True, *size)
+    assert output != gif_bytes, "GIF without loop block was sent unchanged"
+    assert Image.open(BytesIO(output)).info.get("loop") == 0, "re-encoded GIF does not loop forever"
+
+    # With a loop block nothing needs normalizing: the GIF is sent unchanged
+    gif_bytes = _normalized_gif(size, loop=0)
+    assert _resize_image(gif_bytes, True, *size) == gif_bytes, "normalized GIF was re-encoded"
+
+
+def lib_test_gif_disposal_is_normalized(size: tuple[int, int]):
+    # A looping GIF whose frames are all normalized except the last one must
+    # still be re-encoded, with disposal 2 on every frame
+    gif_bytes = _normalized_gif(size, frame_count=8, disposal=[2] * 7 + [1], loop=0)
+    assert _gif_disposals(gif_bytes)[-1] == 1
+    output = _resize_image(gif_bytes, True, *size)
+    assert output != gif_bytes, "GIF with a non-normalized last frame was sent unchanged"
+    assert _gif_disposals(output) == [2] * 8, "re-encoded GIF frames do not all use disposal 2"
+
+    # The check walks the GIF blocks: no frame is decoded, normalized or not
+    loads = []
+    original_load = ImageFile.ImageFile.load
+
+    def counting_load(self, *args, **kwargs):
+        loads.append(self)
+        return original_load(self, *args, **kwargs)
+
+    ImageFile.ImageFile.load = counting_load
+    try:
+        assert not _gif_is_normalized(gif_bytes)
+        assert _gif_is_normalized(output)
+    finally:
+        ImageFile.ImageFile.load = original_load
+    assert not loads, f"normalization check decoded {len(loads)} frame(s)"
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pytest to validate `set_sb_score` renders defined in `tests/resources/set_sb_score.json`."""
+import sys
+from pathlib import Path
+
+# Ensure project src is importable
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from .lib.test_scoreboard import lib_test_set_sb_score_renders
+
+def test_set_sb_score():
+    lib_test_set_sb_score_renders("set_sb_score.json")
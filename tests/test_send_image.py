@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pytest to validate `send_image` windows and GIF normalization."""
+import sys
+from pathlib import Path
+
+# Ensure project src is importable
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from .lib.test_send_image import (
+    lib_test_build_send_plan_windows, lib_test_gif_loop_is_kept, lib_test_gif_disposal_is_normalized
+)
+
+def test_build_send_plan_windows():
+    lib_test_build_send_plan_windows("send_image_windows.json")
+
+def test_gif_without_loop_block_is_reencoded():
+    lib_test_gif_loop_is_kept((64, 64))
+
+def test_gif_with_non_normalized_last_frame_is_reencoded():
+    lib_test_gif_disposal_is_normalized((64, 64))